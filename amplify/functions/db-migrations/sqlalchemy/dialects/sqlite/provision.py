@@ -71,6 +71,22 @@ def _sqlite_post_configure_engine(url, engine, follower_ident):
                 % (follower_ident, engine.driver)
             )
 
+        # the test databases are throwaway files; don't pay for a journal
+        # file and fsync on each of the many CREATE / DROP statements the
+        # suite emits.  journal_mode and temp_store apply to every database
+        # on the connection; synchronous and the page cache / mmap sizes
+        # are per database, so they're set on the attached schema too,
+        # which is the one on disk when the main database is in memory
+        for pragma in ("journal_mode=MEMORY", "temp_store=MEMORY"):
+            dbapi_connection.execute("PRAGMA %s" % pragma)
+        for schema in ("main", "test_schema"):
+            for pragma in (
+                "synchronous=OFF",
+                "cache_size=-16000",
+                "mmap_size=268435456",
+            ):
+                dbapi_connection.execute("PRAGMA %s.%s" % (schema, pragma))
+
 
 @create_db.for_db("sqlite")
 def _sqlite_create_db(cfg, eng, ident):
@@ -32,10 +32,55 @@ from ...testing import is_true
 
 metadata, users = None, None
 
+# tables created by ComponentReflectionTest that test_get_table_names
+# doesn't assert on
+_IGNORE_TABLES = frozenset(
+    [
+        "comment_test",
+        "noncol_idx_test_pk",
+        "noncol_idx_test_nopk",
+        "local_table",
+        "remote_table",
+        "remote_table_2",
+    ]
+)
+
+# generic types a reflected column type must share a base with
+_GENERIC_TYPES = frozenset(
+    [
+        sql_types.Integer,
+        sql_types.Numeric,
+        sql_types.DateTime,
+        sql_types.Date,
+        sql_types.Time,
+        sql_types.String,
+        sql_types._Binary,
+    ]
+)
+
+# tokens test_get_check_constraints compares reflected CHECK sqltext by
+_CC_NORMALIZE_RE = re.compile(r"and|\d|=|a|or|<|>", re.I)
+
+# unique constraints test_get_unique_constraints creates on "testtbl"
+_EXPECTED_UNIQUES = (
+    {"name": "unique_a", "column_names": ["a"]},
+    {"name": "unique_a_b_c", "column_names": ["a", "b", "c"]},
+    {"name": "unique_c_a_b", "column_names": ["c", "a", "b"]},
+    {"name": "unique_asc_key", "column_names": ["asc", "key"]},
+    {"name": "i.have.dots", "column_names": ["b"]},
+    {"name": "i have spaces", "column_names": ["c"]},
+)
+
 
 class OneConnectionTablesTest(fixtures.TablesTest):
+    _default_schema = None
+
     @classmethod
     def setup_bind(cls):
+        # looked up once per class, rather than by each table definition
+        # and test that needs it
+        cls._default_schema = config.db.dialect.default_schema_name
+
         # TODO: when temp tables are subject to server reset,
         # this will also have to disable that server reset from
         # happening
@@ -49,6 +94,46 @@ class OneConnectionTablesTest(fixtures.TablesTest):
             return config.db
 
 
+class CachedInspectorFixture(object):
+    """Share a single :class:`.Inspector` among the tests of a class, so
+    that repeated reflection calls are served from its ``info_cache``.
+
+    """
+
+    _insp = None
+
+    @classmethod
+    def _setup_once_tables(cls):
+        super(CachedInspectorFixture, cls)._setup_once_tables()
+        # anything reflected before the tables existed is stale now
+        cls._insp = None
+
+    @classmethod
+    def teardown_test_class(cls):
+        cls._insp = None
+
+    @classmethod
+    def _cached_inspector(cls):
+        # a class may be bound to a new engine between runs, e.g. the
+        # per-class StaticPool engine of OneConnectionTablesTest
+        if cls._insp is None or cls._insp.bind is not cls.bind:
+            cls._insp = inspect(cls.bind)
+        return cls._insp
+
+    @classmethod
+    def _inspect_connection(cls, connection):
+        """Return an :class:`.Inspector` for ``connection`` which shares
+        the ``info_cache`` of :meth:`._cached_inspector`.
+
+        Only suitable for tests that reflect the tables created once
+        for the class.
+
+        """
+        insp = inspect(connection)
+        insp.info_cache = cls._cached_inspector().info_cache
+        return insp
+
+
 class HasTableTest(OneConnectionTablesTest):
     __backend__ = True
 
@@ -235,7 +320,7 @@ class HasIndexTest(fixtures.TablesTest):
             )
 
 
-class QuotedNameArgumentTest(fixtures.TablesTest):
+class QuotedNameArgumentTest(CachedInspectorFixture, fixtures.TablesTest):
     run_create_tables = "once"
     __backend__ = True
 
@@ -298,80 +383,71 @@ class QuotedNameArgumentTest(fixtures.TablesTest):
                 names = [
                     "quote ' one",
                 ]
+            preparer = config.db.dialect.identifier_preparer
             for name in names:
+                quoted_view = preparer.quote("view %s" % name)
+                quoted_name = preparer.quote(name)
                 query = "CREATE VIEW %s AS SELECT * FROM %s" % (
-                    config.db.dialect.identifier_preparer.quote("view %s" % name),
-                    config.db.dialect.identifier_preparer.quote(name),
+                    quoted_view,
+                    quoted_name,
                 )
 
                 event.listen(metadata, "after_create", DDL(query))
-                event.listen(
-                    metadata,
-                    "before_drop",
-                    DDL(
-                        "DROP VIEW %s"
-                        % config.db.dialect.identifier_preparer.quote("view %s" % name)
-                    ),
-                )
+                event.listen(metadata, "before_drop", DDL("DROP VIEW %s" % quoted_view))
+
+    @testing.fixture(scope="class")
+    def insp(self):
+        return self._cached_inspector()
 
     def quote_fixtures(fn):
         return testing.combinations(
             ("quote ' one",),
             ('quote " two', testing.requires.symbol_names_w_double_quote),
+            argnames="name",
         )(fn)
 
     @quote_fixtures
-    def test_get_table_options(self, name):
-        insp = inspect(config.db)
-
+    def test_get_table_options(self, name, insp):
         insp.get_table_options(name)
 
     @quote_fixtures
     @testing.requires.view_column_reflection
-    def test_get_view_definition(self, name):
-        insp = inspect(config.db)
+    def test_get_view_definition(self, name, insp):
         assert insp.get_view_definition("view %s" % name)
 
     @quote_fixtures
-    def test_get_columns(self, name):
-        insp = inspect(config.db)
+    def test_get_columns(self, name, insp):
         assert insp.get_columns(name)
 
     @quote_fixtures
-    def test_get_pk_constraint(self, name):
-        insp = inspect(config.db)
+    def test_get_pk_constraint(self, name, insp):
         assert insp.get_pk_constraint(name)
 
     @quote_fixtures
-    def test_get_foreign_keys(self, name):
-        insp = inspect(config.db)
+    def test_get_foreign_keys(self, name, insp):
         assert insp.get_foreign_keys(name)
 
     @quote_fixtures
-    def test_get_indexes(self, name):
-        insp = inspect(config.db)
+    def test_get_indexes(self, name, insp):
         assert insp.get_indexes(name)
 
     @quote_fixtures
     @testing.requires.unique_constraint_reflection
-    def test_get_unique_constraints(self, name):
-        insp = inspect(config.db)
+    def test_get_unique_constraints(self, name, insp):
         assert insp.get_unique_constraints(name)
 
     @quote_fixtures
     @testing.requires.comment_reflection
-    def test_get_table_comment(self, name):
-        insp = inspect(config.db)
+    def test_get_table_comment(self, name, insp):
         assert insp.get_table_comment(name)
 
     @quote_fixtures
     @testing.requires.check_constraint_reflection
-    def test_get_check_constraints(self, name):
-        insp = inspect(config.db)
+    def test_get_check_constraints(self, name, insp):
         assert insp.get_check_constraints(name)
 
 
-class ComponentReflectionTest(OneConnectionTablesTest):
+class ComponentReflectionTest(CachedInspectorFixture, OneConnectionTablesTest):
     run_inserts = run_deletes = None
 
     __backend__ = True
@@ -389,7 +465,19 @@ class ComponentReflectionTest(OneConnectionTablesTest):
         else:
             schema_prefix = ""
 
-        if testing.requires.self_referential_foreign_keys.enabled:
+        req = testing.requires
+        has_self_fk = req.self_referential_foreign_keys.enabled
+        has_cross_fk = req.cross_schema_fk_reflection.enabled
+        has_idx = req.index_reflection.enabled
+        has_ascdesc = req.indexes_with_ascdesc.enabled
+        has_view_cols = req.view_column_reflection.enabled
+        has_temp = req.temp_table_reflection.enabled
+
+        users_fk = schema_prefix + "users.user_id"
+        email_fk = schema_prefix + "email_addresses.address_id"
+        remote_fk = "%s.remote_table_2.id" % testing.config.test_schema
+
+        if has_self_fk:
             users = Table(
                 "users",
                 metadata,
@@ -399,7 +487,7 @@ class ComponentReflectionTest(OneConnectionTablesTest):
                 Column(
                     "parent_user_id",
                     sa.Integer,
-                    sa.ForeignKey("%susers.user_id" % schema_prefix, name="user_id_fk"),
+                    sa.ForeignKey(users_fk, name="user_id_fk"),
                 ),
                 schema=schema,
                 test_needs_fk=True,
@@ -422,7 +510,7 @@ class ComponentReflectionTest(OneConnectionTablesTest):
             Column(
                 "address_id",
                 sa.Integer,
-                sa.ForeignKey("%semail_addresses.address_id" % schema_prefix),
+                sa.ForeignKey(email_fk),
             ),
             Column("data", sa.String(30)),
             schema=schema,
@@ -452,7 +540,7 @@ class ComponentReflectionTest(OneConnectionTablesTest):
             comment=r"""the test % ' " \ table comment""",
         )
 
-        if testing.requires.cross_schema_fk_reflection.enabled:
+        if has_cross_fk:
             if schema is None:
                 Table(
                     "local_table",
@@ -461,10 +549,10 @@ class ComponentReflectionTest(OneConnectionTablesTest):
                     Column("data", sa.String(20)),
                     Column(
                         "remote_id",
-                        ForeignKey("%s.remote_table_2.id" % testing.config.test_schema),
+                        ForeignKey(remote_fk),
                     ),
                     test_needs_fk=True,
-                    schema=config.db.dialect.default_schema_name,
+                    schema=cls._default_schema,
                 )
             else:
                 Table(
@@ -473,9 +561,7 @@ class ComponentReflectionTest(OneConnectionTablesTest):
                     Column("id", sa.Integer, primary_key=True),
                     Column(
                         "local_id",
-                        ForeignKey(
-                            "%s.local_table.id" % config.db.dialect.default_schema_name
-                        ),
+                        ForeignKey("%s.local_table.id" % cls._default_schema),
                     ),
                     Column("data", sa.String(20)),
                     schema=schema,
@@ -490,7 +576,7 @@ class ComponentReflectionTest(OneConnectionTablesTest):
                     test_needs_fk=True,
                 )
 
-        if testing.requires.index_reflection.enabled:
+        if has_idx:
             cls.define_index(metadata, users)
 
             if not schema:
@@ -510,13 +596,13 @@ class ComponentReflectionTest(OneConnectionTablesTest):
                     test_needs_fk=True,
                 )
 
-                if testing.requires.indexes_with_ascdesc.enabled:
+                if has_ascdesc:
                     Index("noncol_idx_nopk", noncol_idx_test_nopk.c.q.desc())
                     Index("noncol_idx_pk", noncol_idx_test_pk.c.q.desc())
 
-        if testing.requires.view_column_reflection.enabled:
+        if has_view_cols:
             cls.define_views(metadata, schema)
-        if not schema and testing.requires.temp_table_reflection.enabled:
+        if not schema and has_temp:
             cls.define_temp_tables(metadata)
 
     @classmethod
@@ -562,10 +648,9 @@ class ComponentReflectionTest(OneConnectionTablesTest):
 
     @classmethod
     def define_views(cls, metadata, schema):
+        schema_prefix = "%s." % schema if schema else ""
         for table_name in ("users", "email_addresses"):
-            fullname = table_name
-            if schema:
-                fullname = "%s.%s" % (schema, table_name)
+            fullname = schema_prefix + table_name
             view_name = fullname + "_v"
             query = "CREATE VIEW %s AS SELECT * FROM %s" % (
                 view_name,
@@ -577,7 +662,7 @@ class ComponentReflectionTest(OneConnectionTablesTest):
 
     @testing.requires.schema_reflection
     def test_get_schema_names(self):
-        insp = inspect(self.bind)
+        insp = self._cached_inspector()
 
         self.assert_(testing.config.test_schema in insp.get_schema_names())
 
@@ -603,7 +688,7 @@ class ComponentReflectionTest(OneConnectionTablesTest):
 
     @testing.requires.schema_reflection
     def test_get_default_schema_name(self):
-        insp = inspect(self.bind)
+        insp = self._cached_inspector()
         eq_(insp.default_schema_name, self.bind.dialect.default_schema_name)
 
     @testing.requires.foreign_key_constraint_reflection
@@ -625,20 +710,10 @@ class ComponentReflectionTest(OneConnectionTablesTest):
         else:
             schema = None
 
-        _ignore_tables = [
-            "comment_test",
-            "noncol_idx_test_pk",
-            "noncol_idx_test_nopk",
-            "local_table",
-            "remote_table",
-            "remote_table_2",
-        ]
-
-        insp = inspect(connection)
+        insp = self._inspect_connection(connection)
 
         if include_views:
             table_names = insp.get_view_names(schema)
-            table_names.sort()
             answer = ["email_addresses_v", "users_v"]
             eq_(sorted(table_names), answer)
 
@@ -651,7 +726,7 @@ class ComponentReflectionTest(OneConnectionTablesTest):
                 ]
             else:
                 tables = insp.get_table_names(schema)
-            table_names = [t for t in tables if t not in _ignore_tables]
+            table_names = [t for t in tables if t not in _IGNORE_TABLES]
 
             if order_by == "foreign_key":
                 answer = ["users", "email_addresses", "dingalings"]
@@ -662,17 +737,17 @@ class ComponentReflectionTest(OneConnectionTablesTest):
 
     @testing.requires.temp_table_names
     def test_get_temp_table_names(self):
-        insp = inspect(self.bind)
+        insp = self._cached_inspector()
         temp_table_names = insp.get_temp_table_names()
-        eq_(sorted(temp_table_names), ["user_tmp_%s" % config.ident])
+        eq_(temp_table_names, ["user_tmp_%s" % config.ident])
 
     @testing.requires.view_reflection
     @testing.requires.temp_table_names
     @testing.requires.temporary_views
     def test_get_temp_view_names(self):
-        insp = inspect(self.bind)
+        insp = self._cached_inspector()
         temp_table_names = insp.get_temp_view_names()
-        eq_(sorted(temp_table_names), ["user_tmp_v"])
+        eq_(temp_table_names, ["user_tmp_v"])
 
     @testing.requires.comment_reflection
     def test_get_comments(self):
@@ -684,7 +759,7 @@ class ComponentReflectionTest(OneConnectionTablesTest):
         self._test_get_comments(testing.config.test_schema)
 
     def _test_get_comments(self, schema=None):
-        insp = inspect(self.bind)
+        insp = self._cached_inspector()
 
         eq_(
             insp.get_table_comment("comment_test", schema=schema),
@@ -719,7 +794,7 @@ class ComponentReflectionTest(OneConnectionTablesTest):
         ),
         argnames="use_views,use_schema",
     )
-    def test_get_columns(self, connection, use_views, use_schema):
+    def test_get_columns(self, use_views, use_schema):
         if use_schema:
             schema = config.test_schema
         else:
@@ -731,7 +806,25 @@ class ComponentReflectionTest(OneConnectionTablesTest):
         else:
             table_names = ["users", "email_addresses"]
 
-        insp = inspect(connection)
+        insp = self._cached_inspector()
+
+        def shares_generic_type(col, rec):
+            ctype = rec["type"].__class__
+            ctype_def = col.type
+            if isinstance(ctype_def, sa.types.TypeEngine):
+                ctype_def = ctype_def.__class__
+
+            # Oracle returns Date for DateTime.
+
+            if testing.against("oracle") and ctype_def in (
+                sql_types.Date,
+                sql_types.DateTime,
+            ):
+                ctype_def = sql_types.Date
+
+            def_mro = frozenset(ctype_def.__mro__)
+            return any(t in def_mro and t in _GENERIC_TYPES for t in ctype.__mro__)
+
         for table_name, table in zip(table_names, (users, addresses)):
             schema_name = schema
             cols = insp.get_columns(table_name, schema=schema_name)
@@ -739,46 +832,29 @@ class ComponentReflectionTest(OneConnectionTablesTest):
 
             # should be in order
 
-            for i, col in enumerate(table.columns):
-                eq_(col.name, cols[i]["name"])
-                ctype = cols[i]["type"].__class__
-                ctype_def = col.type
-                if isinstance(ctype_def, sa.types.TypeEngine):
-                    ctype_def = ctype_def.__class__
-
-                # Oracle returns Date for DateTime.
-
-                if testing.against("oracle") and ctype_def in (
-                    sql_types.Date,
-                    sql_types.DateTime,
-                ):
-                    ctype_def = sql_types.Date
-
-                # assert that the desired type and return type share
-                # a base within one of the generic types.
-
-                self.assert_(
-                    len(
-                        set(ctype.__mro__)
-                        .intersection(ctype_def.__mro__)
-                        .intersection(
-                            [
-                                sql_types.Integer,
-                                sql_types.Numeric,
-                                sql_types.DateTime,
-                                sql_types.Date,
-                                sql_types.Time,
-                                sql_types.String,
-                                sql_types._Binary,
-                            ]
-                        )
-                    )
-                    > 0,
-                    "%s(%s), %s(%s)" % (col.name, col.type, cols[i]["name"], ctype),
-                )
+            expected_names = [col.name for col in table.columns]
+            eq_(
+                [rec["name"] for rec in cols[: len(expected_names)]],
+                expected_names,
+            )
 
-                if not col.primary_key:
-                    assert cols[i]["default"] is None
+            # assert that the desired type and return type share
+            # a base within one of the generic types.
+
+            mismatched = [
+                "%s(%s), %s(%s)"
+                % (col.name, col.type, rec["name"], rec["type"].__class__)
+                for col, rec in zip(table.columns, cols)
+                if not shares_generic_type(col, rec)
+            ]
+            self.assert_(not mismatched, "; ".join(mismatched))
+
+            non_pk_defaults = [
+                rec["default"]
+                for col, rec in zip(table.columns, cols)
+                if not col.primary_key
+            ]
+            assert all(d is None for d in non_pk_defaults), non_pk_defaults
 
     @testing.requires.temp_table_reflection
     def test_get_temp_table_columns(self):
@@ -786,7 +862,7 @@ class ComponentReflectionTest(OneConnectionTablesTest):
             config, self.bind, "user_tmp_%s" % config.ident
         )
         user_tmp = self.tables[table_name]
-        insp = inspect(self.bind)
+        insp = self._cached_inspector()
         cols = insp.get_columns(table_name)
         self.assert_(len(cols) > 0, len(cols))
 
@@ -797,7 +873,7 @@ class ComponentReflectionTest(OneConnectionTablesTest):
     @testing.requires.view_column_reflection
     @testing.requires.temporary_views
     def test_get_temp_view_columns(self):
-        insp = inspect(self.bind)
+        insp = self._cached_inspector()
         cols = insp.get_columns("user_tmp_v")
         eq_([col["name"] for col in cols], ["id", "name", "foo"])
 
@@ -805,14 +881,14 @@ class ComponentReflectionTest(OneConnectionTablesTest):
         (False,), (True, testing.requires.schemas), argnames="use_schema"
     )
     @testing.requires.primary_key_constraint_reflection
-    def test_get_pk_constraint(self, connection, use_schema):
+    def test_get_pk_constraint(self, use_schema):
         if use_schema:
             schema = testing.config.test_schema
         else:
             schema = None
 
         users, addresses = self.tables.users, self.tables.email_addresses
-        insp = inspect(connection)
+        insp = self._cached_inspector()
 
         users_cons = insp.get_pk_constraint(users.name, schema=schema)
         users_pkeys = users_cons["constrained_columns"]
@@ -829,14 +905,14 @@ class ComponentReflectionTest(OneConnectionTablesTest):
         (False,), (True, testing.requires.schemas), argnames="use_schema"
     )
     @testing.requires.foreign_key_constraint_reflection
-    def test_get_foreign_keys(self, connection, use_schema):
+    def test_get_foreign_keys(self, use_schema):
         if use_schema:
             schema = config.test_schema
         else:
             schema = None
 
         users, addresses = (self.tables.users, self.tables.email_addresses)
-        insp = inspect(connection)
+        insp = self._cached_inspector()
         expected_schema = schema
         # users
 
@@ -868,43 +944,42 @@ class ComponentReflectionTest(OneConnectionTablesTest):
     @testing.requires.cross_schema_fk_reflection
     @testing.requires.schemas
     def test_get_inter_schema_foreign_keys(self):
+        default_schema = self._default_schema
+        test_schema = testing.config.test_schema
+
         local_table, remote_table, remote_table_2 = self.tables(
-            "%s.local_table" % self.bind.dialect.default_schema_name,
-            "%s.remote_table" % testing.config.test_schema,
-            "%s.remote_table_2" % testing.config.test_schema,
+            "%s.local_table" % default_schema,
+            "%s.remote_table" % test_schema,
+            "%s.remote_table_2" % test_schema,
         )
 
-        insp = inspect(self.bind)
+        insp = self._cached_inspector()
 
         local_fkeys = insp.get_foreign_keys(local_table.name)
         eq_(len(local_fkeys), 1)
 
         fkey1 = local_fkeys[0]
-        eq_(fkey1["referred_schema"], testing.config.test_schema)
+        eq_(fkey1["referred_schema"], test_schema)
         eq_(fkey1["referred_table"], remote_table_2.name)
         eq_(fkey1["referred_columns"], ["id"])
         eq_(fkey1["constrained_columns"], ["remote_id"])
 
-        remote_fkeys = insp.get_foreign_keys(
-            remote_table.name, schema=testing.config.test_schema
-        )
+        remote_fkeys = insp.get_foreign_keys(remote_table.name, schema=test_schema)
         eq_(len(remote_fkeys), 1)
 
         fkey2 = remote_fkeys[0]
 
-        assert fkey2["referred_schema"] in (
-            None,
-            self.bind.dialect.default_schema_name,
-        )
+        # the default schema may or may not be reported
+        assert fkey2["referred_schema"] in (None, default_schema)
         eq_(fkey2["referred_table"], local_table.name)
         eq_(fkey2["referred_columns"], ["id"])
         eq_(fkey2["constrained_columns"], ["local_id"])
 
     def _assert_insp_indexes(self, indexes, expected_indexes):
-        index_names = [d["name"] for d in indexes]
+        by_name = {d["name"]: d for d in indexes}
         for e_index in expected_indexes:
-            assert e_index["name"] in index_names
-            index = indexes[index_names.index(e_index["name"])]
+            assert e_index["name"] in by_name
+            index = by_name[e_index["name"]]
             for key in e_index:
                 eq_(e_index[key], index[key])
 
@@ -919,7 +994,7 @@ class ComponentReflectionTest(OneConnectionTablesTest):
 
         # The database may decide to create indexes for foreign keys, etc.
         # so there may be more indexes than expected.
-        insp = inspect(self.bind)
+        insp = self._cached_inspector()
         indexes = insp.get_indexes("users", schema=schema)
         expected_indexes = [
             {
@@ -943,7 +1018,7 @@ class ComponentReflectionTest(OneConnectionTablesTest):
     @testing.requires.index_reflection
     @testing.requires.indexes_with_ascdesc
     def test_get_noncol_index(self, connection, tname, ixname):
-        insp = inspect(connection)
+        insp = self._inspect_connection(connection)
         indexes = insp.get_indexes(tname)
 
         # reflecting an index that has "x DESC" in it as the column.
@@ -952,7 +1027,10 @@ class ComponentReflectionTest(OneConnectionTablesTest):
         expected_indexes = [{"unique": False, "name": ixname}]
         self._assert_insp_indexes(indexes, expected_indexes)
 
-        t = Table(tname, MetaData(), autoload_with=connection)
+        # the index was checked above; this covers attaching it to a
+        # reflected Table, which needs no referred tables and can be
+        # served from the inspector's cache
+        t = Table(tname, MetaData(), autoload_with=insp, resolve_fks=False)
         eq_(len(t.indexes), 1)
         is_(list(t.indexes)[0].table, t)
         eq_(list(t.indexes)[0].name, ixname)
@@ -960,7 +1038,7 @@ class ComponentReflectionTest(OneConnectionTablesTest):
     @testing.requires.temp_table_reflection
     @testing.requires.unique_constraint_reflection
     def test_get_temp_table_unique_constraints(self):
-        insp = inspect(self.bind)
+        insp = self._cached_inspector()
         reflected = insp.get_unique_constraints("user_tmp_%s" % config.ident)
         for refl in reflected:
             # Different dialects handle duplicate index and constraints
@@ -978,7 +1056,7 @@ class ComponentReflectionTest(OneConnectionTablesTest):
 
     @testing.requires.temp_table_reflect_indexes
     def test_get_temp_table_indexes(self):
-        insp = inspect(self.bind)
+        insp = self._cached_inspector()
         table_name = get_temp_table_name(
             config, config.db, "user_tmp_%s" % config.ident
         )
@@ -1009,17 +1087,7 @@ class ComponentReflectionTest(OneConnectionTablesTest):
             schema = config.test_schema
         else:
             schema = None
-        uniques = sorted(
-            [
-                {"name": "unique_a", "column_names": ["a"]},
-                {"name": "unique_a_b_c", "column_names": ["a", "b", "c"]},
-                {"name": "unique_c_a_b", "column_names": ["c", "a", "b"]},
-                {"name": "unique_asc_key", "column_names": ["asc", "key"]},
-                {"name": "i.have.dots", "column_names": ["b"]},
-                {"name": "i have spaces", "column_names": ["c"]},
-            ],
-            key=operator.itemgetter("name"),
-        )
+        uniques = _EXPECTED_UNIQUES
         table = Table(
             "testtbl",
             metadata,
@@ -1038,22 +1106,21 @@ class ComponentReflectionTest(OneConnectionTablesTest):
         table.create(connection)
 
         inspector = inspect(connection)
-        reflected = sorted(
-            inspector.get_unique_constraints("testtbl", schema=schema),
-            key=operator.itemgetter("name"),
-        )
+        reflected = inspector.get_unique_constraints("testtbl", schema=schema)
 
         names_that_duplicate_index = set()
 
         eq_(len(uniques), len(reflected))
 
-        for orig, refl in zip(uniques, reflected):
+        expected_by_name = {uc["name"]: uc for uc in uniques}
+        for refl in reflected:
             # Different dialects handle duplicate index and constraints
             # differently, so ignore this flag
             dupe = refl.pop("duplicates_index", None)
             if dupe:
                 names_that_duplicate_index.add(dupe)
-            eq_(orig, refl)
+            eq_(expected_by_name.pop(refl["name"], None), refl)
+        eq_(expected_by_name, {})
 
         reflected_metadata = MetaData()
         reflected = Table(
@@ -1067,16 +1134,14 @@ class ComponentReflectionTest(OneConnectionTablesTest):
         # "unique constraints" are actually unique indexes (with possible
         # exception of a unique that is a dupe of another one in the case
         # of Oracle).  make sure # they aren't duplicated.
-        idx_names = set([idx.name for idx in reflected.indexes])
-        uq_names = set(
-            [
-                uq.name
-                for uq in reflected.constraints
-                if isinstance(uq, sa.UniqueConstraint)
-            ]
-        ).difference(["unique_c_a_b"])
-
-        assert not idx_names.intersection(uq_names)
+        idx_names = {idx.name for idx in reflected.indexes}
+        uq_names = {
+            uq.name
+            for uq in reflected.constraints
+            if isinstance(uq, sa.UniqueConstraint)
+        } - {"unique_c_a_b"}
+
+        assert idx_names.isdisjoint(uq_names)
         if names_that_duplicate_index:
             eq_(names_that_duplicate_index, idx_names)
             eq_(uq_names, set())
@@ -1092,7 +1157,7 @@ class ComponentReflectionTest(OneConnectionTablesTest):
             schema = None
         view_name1 = "users_v"
         view_name2 = "email_addresses_v"
-        insp = inspect(connection)
+        insp = self._inspect_connection(connection)
         v1 = insp.get_view_definition(view_name1, schema=schema)
         self.assert_(v1)
         v2 = insp.get_view_definition(view_name2, schema=schema)
@@ -1110,7 +1175,7 @@ class ComponentReflectionTest(OneConnectionTablesTest):
             schema = config.test_schema
         else:
             schema = None
-        insp = inspect(connection)
+        insp = self._inspect_connection(connection)
         oid = insp.get_table_oid(table_name, schema)
         self.assert_(isinstance(oid, int))
 
@@ -1128,68 +1193,61 @@ class ComponentReflectionTest(OneConnectionTablesTest):
 
         """
 
-        insp = inspect(self.bind)
+        insp = self._cached_inspector()
 
         for tname, cname in [
             ("users", "user_id"),
             ("email_addresses", "address_id"),
             ("dingalings", "dingaling_id"),
         ]:
-            cols = insp.get_columns(tname)
-            id_ = {c["name"]: c for c in cols}[cname]
+            id_ = next(c for c in insp.get_columns(tname) if c["name"] == cname)
             assert id_.get("autoincrement", True)
 
 
-class TableNoColumnsTest(fixtures.TestBase):
+class TableNoColumnsTest(fixtures.TablesTest):
     __requires__ = ("reflect_tables_no_columns",)
     __backend__ = True
 
-    @testing.fixture
-    def table_no_columns(self, connection, metadata):
-        Table("empty", metadata)
-        metadata.create_all(connection)
-
-    @testing.fixture
-    def view_no_columns(self, connection, metadata):
-        Table("empty", metadata)
-        metadata.create_all(connection)
+    run_inserts = run_deletes = None
 
+    @classmethod
+    def define_tables(cls, metadata):
+        # the tests only read the catalog, so "empty" and its view are
+        # created once for the class
         Table("empty", metadata)
-        event.listen(
-            metadata,
-            "after_create",
-            DDL("CREATE VIEW empty_v AS SELECT * FROM empty"),
-        )
 
-        # for transactional DDL the transaction is rolled back before this
-        # drop statement is invoked
-        event.listen(metadata, "before_drop", DDL("DROP VIEW IF EXISTS empty_v"))
-        metadata.create_all(connection)
+        if testing.requires.views.enabled:
+            event.listen(
+                metadata,
+                "after_create",
+                DDL("CREATE VIEW empty_v AS SELECT * FROM empty"),
+            )
+            event.listen(metadata, "before_drop", DDL("DROP VIEW IF EXISTS empty_v"))
 
     @testing.requires.reflect_tables_no_columns
-    def test_reflect_table_no_columns(self, connection, table_no_columns):
+    def test_reflect_table_no_columns(self, connection):
         t2 = Table("empty", MetaData(), autoload_with=connection)
         eq_(list(t2.c), [])
 
     @testing.requires.reflect_tables_no_columns
-    def test_get_columns_table_no_columns(self, connection, table_no_columns):
+    def test_get_columns_table_no_columns(self, connection):
         eq_(inspect(connection).get_columns("empty"), [])
 
     @testing.requires.reflect_tables_no_columns
-    def test_reflect_incl_table_no_columns(self, connection, table_no_columns):
+    def test_reflect_incl_table_no_columns(self, connection):
         m = MetaData()
         m.reflect(connection)
         assert set(m.tables).intersection(["empty"])
 
     @testing.requires.views
     @testing.requires.reflect_tables_no_columns
-    def test_reflect_view_no_columns(self, connection, view_no_columns):
+    def test_reflect_view_no_columns(self, connection):
         t2 = Table("empty_v", MetaData(), autoload_with=connection)
         eq_(list(t2.c), [])
 
     @testing.requires.views
     @testing.requires.reflect_tables_no_columns
-    def test_get_columns_view_no_columns(self, connection, view_no_columns):
+    def test_get_columns_view_no_columns(self, connection):
         eq_(inspect(connection).get_columns("empty_v"), [])
 
 
@@ -1227,7 +1285,7 @@ class ComponentReflectionTestExtra(fixtures.TestBase):
         # may need to add more to this as new dialects get CHECK
         # constraint reflection support
         def normalize(sqltext):
-            return " ".join(re.findall(r"and|\d|=|a|or|<|>", sqltext.lower(), re.I))
+            return " ".join(_CC_NORMALIZE_RE.findall(sqltext.lower()))
 
         reflected = [
             {"name": item["name"], "sqltext": normalize(item["sqltext"])}
@@ -1278,6 +1336,8 @@ class ComponentReflectionTestExtra(fixtures.TestBase):
 
     @testing.requires.index_reflects_included_columns
     def test_reflect_covering_index(self, metadata, connection):
+        engine_name = connection.engine.name
+
         t = Table(
             "t",
             metadata,
@@ -1285,7 +1345,7 @@ class ComponentReflectionTestExtra(fixtures.TestBase):
             Column("y", String(30)),
         )
         idx = Index("t_idx", t.c.x)
-        idx.dialect_options[connection.engine.name]["include"] = ["y"]
+        idx.dialect_options[engine_name]["include"] = ["y"]
 
         metadata.create_all(connection)
 
@@ -1299,14 +1359,14 @@ class ComponentReflectionTestExtra(fixtures.TestBase):
                     "column_names": ["x"],
                     "include_columns": ["y"],
                     "unique": False,
-                    "dialect_options": {"%s_include" % connection.engine.name: ["y"]},
+                    "dialect_options": {"%s_include" % engine_name: ["y"]},
                 }
             ],
         )
 
         t2 = Table("t", MetaData(), autoload_with=connection)
         eq_(
-            list(t2.indexes)[0].dialect_options[connection.engine.name]["include"],
+            list(t2.indexes)[0].dialect_options[engine_name]["include"],
             ["y"],
         )
 
@@ -1343,10 +1403,10 @@ class ComponentReflectionTestExtra(fixtures.TestBase):
         )
         t.create(connection)
         eq_(
-            dict(
-                (col["name"], col["nullable"])
+            {
+                col["name"]: col["nullable"]
                 for col in inspect(connection).get_columns("t")
-            ),
+            },
             {"a": True, "b": False},
         )
 
@@ -1435,7 +1495,7 @@ class ComponentReflectionTestExtra(fixtures.TestBase):
         # that can reflect these, since alembic looks for this
         opts = insp.get_foreign_keys("table")[0]["options"]
 
-        eq_(dict((k, opts[k]) for k in opts if opts[k]), {})
+        eq_({k: v for k, v in opts.items() if v}, {})
 
         opts = insp.get_foreign_keys("user")[0]["options"]
         eq_(opts, expected)
@@ -1479,21 +1539,30 @@ class NormalizedNameTest(fixtures.TablesTest):
         eq_(tablenames[1].upper(), tablenames[1].lower())
 
 
-class ComputedReflectionTest(fixtures.ComputedReflectionFixtureTest):
-    def test_computed_col_default_not_set(self):
-        insp = inspect(config.db)
+class ComputedReflectionTest(
+    CachedInspectorFixture, fixtures.ComputedReflectionFixtureTest
+):
+    @classmethod
+    def _columns_by_name(cls, table_name, schema=None):
+        insp = cls._cached_inspector()
+        return {c["name"]: c for c in insp.get_columns(table_name, schema=schema)}
 
-        cols = insp.get_columns("computed_default_table")
-        col_data = {c["name"]: c for c in cols}
+    @testing.fixture(scope="class")
+    def default_table_cols(self):
+        return self._columns_by_name("computed_default_table")
+
+    @testing.fixture(scope="class")
+    def column_table_cols(self):
+        return self._columns_by_name("computed_column_table")
+
+    def test_computed_col_default_not_set(self, default_table_cols):
+        col_data = default_table_cols
         is_true("42" in col_data["with_default"]["default"])
         is_(col_data["normal"]["default"], None)
         is_(col_data["computed_col"]["default"], None)
 
-    def test_get_column_returns_computed(self):
-        insp = inspect(config.db)
-
-        cols = insp.get_columns("computed_default_table")
-        data = {c["name"]: c for c in cols}
+    def test_get_column_returns_computed(self, default_table_cols):
+        data = default_table_cols
         for key in ("id", "normal", "with_default"):
             is_true("computed" not in data[key])
         compData = data["computed_col"]
@@ -1518,11 +1587,8 @@ class ComputedReflectionTest(fixtures.ComputedReflectionFixtureTest):
             is_true("persisted" in compData)
             is_(compData["persisted"], persisted)
 
-    def test_get_column_returns_persisted(self):
-        insp = inspect(config.db)
-
-        cols = insp.get_columns("computed_column_table")
-        data = {c["name"]: c for c in cols}
+    def test_get_column_returns_persisted(self, column_table_cols):
+        data = column_table_cols
 
         self.check_column(
             data,
@@ -1547,10 +1613,7 @@ class ComputedReflectionTest(fixtures.ComputedReflectionFixtureTest):
 
     @testing.requires.schemas
     def test_get_column_returns_persisted_with_schema(self):
-        insp = inspect(config.db)
-
-        cols = insp.get_columns("computed_column_table", schema=config.test_schema)
-        data = {c["name"]: c for c in cols}
+        data = self._columns_by_name("computed_column_table", schema=config.test_schema)
 
         self.check_column(
             data,
@@ -1574,7 +1637,7 @@ class ComputedReflectionTest(fixtures.ComputedReflectionFixtureTest):
             )
 
 
-class IdentityReflectionTest(fixtures.TablesTest):
+class IdentityReflectionTest(CachedInspectorFixture, fixtures.TablesTest):
     run_inserts = run_deletes = None
 
     __backend__ = True
@@ -1643,76 +1706,70 @@ class IdentityReflectionTest(fixtures.TablesTest):
             eq_(value["start"], exp["start"])
             eq_(value["increment"], exp["increment"])
 
+    def check_identity_column(self, col, exp, approx):
+        is_true(col["autoincrement"] in (True, "auto"))
+        eq_(col["default"], None)
+        is_true("identity" in col)
+        self.check(col["identity"], exp, approx=approx)
+
     def test_reflect_identity(self):
-        insp = inspect(config.db)
-
-        cols = insp.get_columns("t1") + insp.get_columns("t2")
-        for col in cols:
-            if col["name"] == "normal":
-                is_false("identity" in col)
-            elif col["name"] == "id1":
-                is_true(col["autoincrement"] in (True, "auto"))
-                eq_(col["default"], None)
-                is_true("identity" in col)
-                self.check(
-                    col["identity"],
-                    dict(
-                        always=False,
-                        start=1,
-                        increment=1,
-                        minvalue=1,
-                        maxvalue=2147483647,
-                        cycle=False,
-                        cache=1,
-                    ),
-                    approx=True,
-                )
-            elif col["name"] == "id2":
-                is_true(col["autoincrement"] in (True, "auto"))
-                eq_(col["default"], None)
-                is_true("identity" in col)
-                self.check(
-                    col["identity"],
-                    dict(
-                        always=True,
-                        start=2,
-                        increment=3,
-                        minvalue=-2,
-                        maxvalue=42,
-                        cycle=True,
-                        cache=4,
-                    ),
-                    approx=False,
-                )
+        insp = self._cached_inspector()
+
+        t1_cols = {col["name"]: col for col in insp.get_columns("t1")}
+        t2_cols = {col["name"]: col for col in insp.get_columns("t2")}
+        is_false("identity" in t1_cols["normal"])
+        self.check_identity_column(
+            t1_cols["id1"],
+            dict(
+                always=False,
+                start=1,
+                increment=1,
+                minvalue=1,
+                maxvalue=2147483647,
+                cycle=False,
+                cache=1,
+            ),
+            approx=True,
+        )
+        self.check_identity_column(
+            t2_cols["id2"],
+            dict(
+                always=True,
+                start=2,
+                increment=3,
+                minvalue=-2,
+                maxvalue=42,
+                cycle=True,
+                cache=4,
+            ),
+            approx=False,
+        )
 
     @testing.requires.schemas
     def test_reflect_identity_schema(self):
-        insp = inspect(config.db)
-
-        cols = insp.get_columns("t1", schema=config.test_schema)
-        for col in cols:
-            if col["name"] == "normal":
-                is_false("identity" in col)
-            elif col["name"] == "id1":
-                is_true(col["autoincrement"] in (True, "auto"))
-                eq_(col["default"], None)
-                is_true("identity" in col)
-                self.check(
-                    col["identity"],
-                    dict(
-                        always=True,
-                        start=20,
-                        increment=1,
-                        minvalue=1,
-                        maxvalue=2147483647,
-                        cycle=False,
-                        cache=1,
-                    ),
-                    approx=True,
-                )
+        insp = self._cached_inspector()
+
+        cols = {
+            col["name"]: col
+            for col in insp.get_columns("t1", schema=config.test_schema)
+        }
+        is_false("identity" in cols["normal"])
+        self.check_identity_column(
+            cols["id1"],
+            dict(
+                always=True,
+                start=20,
+                increment=1,
+                minvalue=1,
+                maxvalue=2147483647,
+                cycle=False,
+                cache=1,
+            ),
+            approx=True,
+        )
 
 
-class CompositeKeyReflectionTest(fixtures.TablesTest):
+class CompositeKeyReflectionTest(CachedInspectorFixture, fixtures.TablesTest):
     __backend__ = True
 
     @classmethod
@@ -1746,19 +1803,21 @@ class CompositeKeyReflectionTest(fixtures.TablesTest):
     @testing.requires.primary_key_constraint_reflection
     def test_pk_column_order(self):
         # test for issue #5661
-        insp = inspect(self.bind)
+        insp = self._cached_inspector()
         primary_key = insp.get_pk_constraint(self.tables.tb1.name)
         eq_(primary_key.get("constrained_columns"), ["name", "id", "attr"])
 
     @testing.requires.foreign_key_constraint_reflection
     def test_fk_column_order(self):
         # test for issue #5661
-        insp = inspect(self.bind)
+        insp = self._cached_inspector()
         foreign_keys = insp.get_foreign_keys(self.tables.tb2.name)
         eq_(len(foreign_keys), 1)
-        fkey1 = foreign_keys[0]
-        eq_(fkey1.get("referred_columns"), ["name", "id", "attr"])
-        eq_(fkey1.get("constrained_columns"), ["pname", "pid", "pattr"])
+        get_columns = operator.itemgetter("referred_columns", "constrained_columns")
+        eq_(
+            get_columns(foreign_keys[0]),
+            (["name", "id", "attr"], ["pname", "pid", "pattr"]),
+        )
 
 
 __all__ = (
@@ -15,27 +15,54 @@ from sqlalchemy.util import u
 from sqlalchemy.util import ue
 
 
+# the unicode table and column names, built once rather than by a
+# u() / ue() call in every statement and lookup below
+_TBL_UNI1 = u("unitable1")
+_TBL_UNI2 = u("Unitéble2")
+_TBL_CESHI = ue("\u6e2c\u8a66")
+_COL_MEIL = u("méil")
+_COL_CESHI = ue("\u6e2c\u8a66")
+_COL_CESHI_ID = ue("\u6e2c\u8a66_id")
+_COL_UNI1_CESHI = ue("unitable1_\u6e2c\u8a66")
+_COL_UNITEBLE2_B = u("Unitéble2_b")
+_COL_CESHI_SELF = ue("\u6e2c\u8a66_self")
+
+# repr() of the Table built by test_repr
+if util.py2k:
+    _EXPECTED_REPR = (
+        "Table('\\u6e2c\\u8a66', MetaData(), "
+        "Column('\\u6e2c\\u8a66_id', Integer(), "
+        "table=<\u6e2c\u8a66>), "
+        "schema=None)"
+    )
+else:
+    _EXPECTED_REPR = (
+        "Table('測試', MetaData(), "
+        "Column('測試_id', Integer(), "
+        "table=<測試>), "
+        "schema=None)"
+    )
+
+
 class UnicodeSchemaTest(fixtures.TablesTest):
     __requires__ = ("unicode_ddl",)
     __backend__ = True
 
     @classmethod
     def define_tables(cls, metadata):
-        global t1, t2, t3
-
-        t1 = Table(
-            u("unitable1"),
+        Table(
+            _TBL_UNI1,
             metadata,
-            Column(u("méil"), Integer, primary_key=True),
-            Column(ue("\u6e2c\u8a66"), Integer),
+            Column(_COL_MEIL, Integer, primary_key=True),
+            Column(_COL_CESHI, Integer),
             test_needs_fk=True,
         )
-        t2 = Table(
-            u("Unitéble2"),
+        Table(
+            _TBL_UNI2,
             metadata,
-            Column(u("méil"), Integer, primary_key=True, key="a"),
+            Column(_COL_MEIL, Integer, primary_key=True, key="a"),
             Column(
-                ue("\u6e2c\u8a66"),
+                _COL_CESHI,
                 Integer,
                 ForeignKey(u("unitable1.méil")),
                 key="b",
@@ -45,154 +72,131 @@ class UnicodeSchemaTest(fixtures.TablesTest):
 
         # Few DBs support Unicode foreign keys
         if testing.against("sqlite"):
-            t3 = Table(
-                ue("\u6e2c\u8a66"),
+            Table(
+                _TBL_CESHI,
                 metadata,
                 Column(
-                    ue("\u6e2c\u8a66_id"),
+                    _COL_CESHI_ID,
                     Integer,
                     primary_key=True,
                     autoincrement=False,
                 ),
                 Column(
-                    ue("unitable1_\u6e2c\u8a66"),
+                    _COL_UNI1_CESHI,
                     Integer,
                     ForeignKey(ue("unitable1.\u6e2c\u8a66")),
                 ),
-                Column(u("Unitéble2_b"), Integer, ForeignKey(u("Unitéble2.b"))),
+                Column(_COL_UNITEBLE2_B, Integer, ForeignKey(u("Unitéble2.b"))),
                 Column(
-                    ue("\u6e2c\u8a66_self"),
+                    _COL_CESHI_SELF,
                     Integer,
                     ForeignKey(ue("\u6e2c\u8a66.\u6e2c\u8a66_id")),
                 ),
                 test_needs_fk=True,
             )
         else:
-            t3 = Table(
-                ue("\u6e2c\u8a66"),
+            Table(
+                _TBL_CESHI,
                 metadata,
                 Column(
-                    ue("\u6e2c\u8a66_id"),
+                    _COL_CESHI_ID,
                     Integer,
                     primary_key=True,
                     autoincrement=False,
                 ),
-                Column(ue("unitable1_\u6e2c\u8a66"), Integer),
-                Column(u("Unitéble2_b"), Integer),
-                Column(ue("\u6e2c\u8a66_self"), Integer),
+                Column(_COL_UNI1_CESHI, Integer),
+                Column(_COL_UNITEBLE2_B, Integer),
+                Column(_COL_CESHI_SELF, Integer),
                 test_needs_fk=True,
             )
 
+    @classmethod
+    def _unicode_tables(cls):
+        return cls.tables(_TBL_UNI1, _TBL_UNI2, _TBL_CESHI)
+
+    def _insert_rows(self, connection, id_, value):
+        # one row per table, in foreign key order, all within the
+        # connection fixture's transaction
+        t1, t2, t3 = self._unicode_tables()
+        for table, params in (
+            (t1, {_COL_MEIL: id_, _COL_CESHI: value}),
+            (t2, {"a": id_, "b": id_}),
+            (
+                t3,
+                {
+                    _COL_CESHI_ID: id_,
+                    _COL_UNI1_CESHI: value,
+                    _COL_UNITEBLE2_B: id_,
+                    _COL_CESHI_SELF: id_,
+                },
+            ),
+        ):
+            connection.execute(table.insert(), params)
+
     def test_insert(self, connection):
-        connection.execute(t1.insert(), {u("méil"): 1, ue("\u6e2c\u8a66"): 5})
-        connection.execute(t2.insert(), {u("a"): 1, u("b"): 1})
-        connection.execute(
-            t3.insert(),
-            {
-                ue("\u6e2c\u8a66_id"): 1,
-                ue("unitable1_\u6e2c\u8a66"): 5,
-                u("Unitéble2_b"): 1,
-                ue("\u6e2c\u8a66_self"): 1,
-            },
-        )
+        t1, t2, t3 = self._unicode_tables()
+        self._insert_rows(connection, 1, 5)
 
         eq_(connection.execute(t1.select()).fetchall(), [(1, 5)])
         eq_(connection.execute(t2.select()).fetchall(), [(1, 1)])
         eq_(connection.execute(t3.select()).fetchall(), [(1, 5, 1, 1)])
 
     def test_col_targeting(self, connection):
-        connection.execute(t1.insert(), {u("méil"): 1, ue("\u6e2c\u8a66"): 5})
-        connection.execute(t2.insert(), {u("a"): 1, u("b"): 1})
-        connection.execute(
-            t3.insert(),
-            {
-                ue("\u6e2c\u8a66_id"): 1,
-                ue("unitable1_\u6e2c\u8a66"): 5,
-                u("Unitéble2_b"): 1,
-                ue("\u6e2c\u8a66_self"): 1,
-            },
-        )
-
-        row = connection.execute(t1.select()).first()
-        eq_(row._mapping[t1.c[u("méil")]], 1)
-        eq_(row._mapping[t1.c[ue("\u6e2c\u8a66")]], 5)
-
-        row = connection.execute(t2.select()).first()
-        eq_(row._mapping[t2.c[u("a")]], 1)
-        eq_(row._mapping[t2.c[u("b")]], 1)
-
-        row = connection.execute(t3.select()).first()
-        eq_(row._mapping[t3.c[ue("\u6e2c\u8a66_id")]], 1)
-        eq_(row._mapping[t3.c[ue("unitable1_\u6e2c\u8a66")]], 5)
-        eq_(row._mapping[t3.c[u("Unitéble2_b")]], 1)
-        eq_(row._mapping[t3.c[ue("\u6e2c\u8a66_self")]], 1)
+        t1, t2, t3 = self._unicode_tables()
+        self._insert_rows(connection, 1, 5)
+
+        for table, expected in (
+            (t1, [(_COL_MEIL, 1), (_COL_CESHI, 5)]),
+            (t2, [("a", 1), ("b", 1)]),
+            (
+                t3,
+                [
+                    (_COL_CESHI_ID, 1),
+                    (_COL_UNI1_CESHI, 5),
+                    (_COL_UNITEBLE2_B, 1),
+                    (_COL_CESHI_SELF, 1),
+                ],
+            ),
+        ):
+            mapping = connection.execute(table.select()).first()._mapping
+            for key, value in expected:
+                eq_(mapping[table.c[key]], value)
 
     def test_reflect(self, connection):
-        connection.execute(t1.insert(), {u("méil"): 2, ue("\u6e2c\u8a66"): 7})
-        connection.execute(t2.insert(), {u("a"): 2, u("b"): 2})
-        connection.execute(
-            t3.insert(),
-            {
-                ue("\u6e2c\u8a66_id"): 2,
-                ue("unitable1_\u6e2c\u8a66"): 7,
-                u("Unitéble2_b"): 2,
-                ue("\u6e2c\u8a66_self"): 2,
-            },
-        )
+        t1, t2, t3 = self._unicode_tables()
+        self._insert_rows(connection, 2, 7)
 
         meta = MetaData()
         tt1 = Table(t1.name, meta, autoload_with=connection)
         tt2 = Table(t2.name, meta, autoload_with=connection)
         tt3 = Table(t3.name, meta, autoload_with=connection)
 
-        connection.execute(tt1.insert(), {u("méil"): 1, ue("\u6e2c\u8a66"): 5})
-        connection.execute(tt2.insert(), {u("méil"): 1, ue("\u6e2c\u8a66"): 1})
+        connection.execute(tt1.insert(), {_COL_MEIL: 1, _COL_CESHI: 5})
+        connection.execute(tt2.insert(), {_COL_MEIL: 1, _COL_CESHI: 1})
         connection.execute(
             tt3.insert(),
             {
-                ue("\u6e2c\u8a66_id"): 1,
-                ue("unitable1_\u6e2c\u8a66"): 5,
-                u("Unitéble2_b"): 1,
-                ue("\u6e2c\u8a66_self"): 1,
+                _COL_CESHI_ID: 1,
+                _COL_UNI1_CESHI: 5,
+                _COL_UNITEBLE2_B: 1,
+                _COL_CESHI_SELF: 1,
             },
         )
 
         eq_(
-            connection.execute(tt1.select().order_by(desc(u("méil")))).fetchall(),
+            connection.execute(tt1.select().order_by(desc(_COL_MEIL))).fetchall(),
             [(2, 7), (1, 5)],
         )
         eq_(
-            connection.execute(tt2.select().order_by(desc(u("méil")))).fetchall(),
+            connection.execute(tt2.select().order_by(desc(_COL_MEIL))).fetchall(),
             [(2, 2), (1, 1)],
         )
         eq_(
-            connection.execute(
-                tt3.select().order_by(desc(ue("\u6e2c\u8a66_id")))
-            ).fetchall(),
+            connection.execute(tt3.select().order_by(desc(_COL_CESHI_ID))).fetchall(),
             [(2, 7, 2, 2), (1, 5, 1, 1)],
         )
 
     def test_repr(self):
         meta = MetaData()
-        t = Table(ue("\u6e2c\u8a66"), meta, Column(ue("\u6e2c\u8a66_id"), Integer))
-
-        if util.py2k:
-            eq_(
-                repr(t),
-                (
-                    "Table('\\u6e2c\\u8a66', MetaData(), "
-                    "Column('\\u6e2c\\u8a66_id', Integer(), "
-                    "table=<\u6e2c\u8a66>), "
-                    "schema=None)"
-                ),
-            )
-        else:
-            eq_(
-                repr(t),
-                (
-                    "Table('測試', MetaData(), "
-                    "Column('測試_id', Integer(), "
-                    "table=<測試>), "
-                    "schema=None)"
-                ),
-            )
+        t = Table(_TBL_CESHI, meta, Column(_COL_CESHI_ID, Integer))
+        eq_(repr(t), _EXPECTED_REPR)
@@ -9,6 +9,8 @@
 
 from __future__ import absolute_import
 
+import heapq
+import itertools
 import operator
 import types
 import weakref
@@ -81,6 +83,15 @@ def _immutabledict_py_fallback():
 
             return new
 
+        def __or__(self, __d):
+            if not isinstance(__d, dict):
+                return NotImplemented
+            return self.union(__d)
+
+        # dict.__ior__ on Python 3.9+ would update in place; an
+        # immutabledict instead rebinds the name to a new merged copy
+        __ior__ = __or__
+
         def __repr__(self):
             return "immutabledict(%s)" % dict.__repr__(self)
 
@@ -101,7 +112,9 @@ except ImportError:
 
 
 def coerce_to_immutabledict(d):
-    if not d:
+    if d.__class__ is immutabledict:
+        return d
+    elif not d:
         return EMPTY_DICT
     elif isinstance(d, immutabledict):
         return d
@@ -194,10 +207,7 @@ class Properties(object):
         self._data.update(value)
 
     def get(self, key, default=None):
-        if key in self:
-            return self[key]
-        else:
-            return default
+        return self._data.get(key, default)
 
     def keys(self):
         return list(self._data)
@@ -243,7 +253,17 @@ def _ordered_dictionary_sort(d, key=None):
 
 if py37:
     OrderedDict = dict
-    sort_dictionary = _ordered_dictionary_sort
+
+    def sort_dictionary(d, key=None):
+        """Sort a dictionary in place."""
+
+        # merging from a dict rather than a list of tuples lets
+        # update() take the presized dict-to-dict copy
+        items = {k: d[k] for k in sorted(d, key=key)}
+
+        d.clear()
+
+        d.update(items)
 
 else:
     # prevent sort_dictionary from being used against a plain dictionary
@@ -364,6 +384,16 @@ class OrderedSet(set):
         else:
             self._list = []
 
+    @classmethod
+    def _from_list(cls, new_list):
+        # new_list is known to hold unique elements already, so skip
+        # the unique_list() pass of __init__
+        new = cls.__new__(cls)
+        set.__init__(new)
+        new._list = new_list
+        set.update(new, new_list)
+        return new
+
     def add(self, element):
         if element not in self:
             self._list.append(element)
@@ -402,43 +432,48 @@ class OrderedSet(set):
     __str__ = __repr__
 
     def update(self, iterable):
+        append = self._list.append
         for e in iterable:
             if e not in self:
-                self._list.append(e)
+                append(e)
                 set.add(self, e)
         return self
 
     __ior__ = update
 
     def union(self, other):
-        result = self.__class__(self)
+        result = self._from_list(list(self._list))
         result.update(other)
         return result
 
     __or__ = union
 
     def intersection(self, other):
-        other = set(other)
-        return self.__class__(a for a in self if a in other)
+        if not isinstance(other, (set, frozenset)):
+            other = set(other)
+        return self._from_list([a for a in self._list if a in other])
 
     __and__ = intersection
 
     def symmetric_difference(self, other):
-        other = set(other)
-        result = self.__class__(a for a in self if a not in other)
+        if not isinstance(other, (set, frozenset)):
+            other = set(other)
+        result = self._from_list([a for a in self._list if a not in other])
         result.update(a for a in other if a not in self)
         return result
 
     __xor__ = symmetric_difference
 
     def difference(self, other):
-        other = set(other)
-        return self.__class__(a for a in self if a not in other)
+        if not isinstance(other, (set, frozenset)):
+            other = set(other)
+        return self._from_list([a for a in self._list if a not in other])
 
     __sub__ = difference
 
     def intersection_update(self, other):
-        other = set(other)
+        if not isinstance(other, (set, frozenset)):
+            other = set(other)
         set.intersection_update(self, other)
         self._list = [a for a in self._list if a in other]
         return self
@@ -446,9 +481,14 @@ class OrderedSet(set):
     __iand__ = intersection_update
 
     def symmetric_difference_update(self, other):
+        if isinstance(other, OrderedSet):
+            other = other._list
+        else:
+            other = unique_list(other)
         set.symmetric_difference_update(self, other)
-        self._list = [a for a in self._list if a in self]
-        self._list += [a for a in other._list if a in self]
+        new_list = [a for a in self._list if a in self]
+        new_list.extend(a for a in other if a in self)
+        self._list = new_list
         return self
 
     __ixor__ = symmetric_difference_update
@@ -520,6 +560,9 @@ class IdentitySet(object):
         else:
             other = self.__class__(iterable)
 
+        if not py2k:
+            return self._members.keys() <= other._members.keys()
+
         if len(self) > len(other):
             return False
         for m in itertools_filterfalse(
@@ -544,6 +587,9 @@ class IdentitySet(object):
         else:
             other = self.__class__(iterable)
 
+        if not py2k:
+            return self._members.keys() >= other._members.keys()
+
         if len(self) < len(other):
             return False
 
@@ -588,7 +634,8 @@ class IdentitySet(object):
         result = self.__class__()
         members = self._members
         if isinstance(iterable, self.__class__):
-            other = set(iterable._members.keys())
+            # the id-keyed dict answers "in" just as a set of its keys would
+            other = iterable._members
         else:
             other = {id(obj) for obj in iterable}
         result._members.update(((k, v) for k, v in members.items() if k not in other))
@@ -612,7 +659,8 @@ class IdentitySet(object):
         result = self.__class__()
         members = self._members
         if isinstance(iterable, self.__class__):
-            other = set(iterable._members.keys())
+            # the id-keyed dict answers "in" just as a set of its keys would
+            other = iterable._members
         else:
             other = {id(obj) for obj in iterable}
         result._members.update((k, v) for k, v in members.items() if k in other)
@@ -694,12 +742,14 @@ class WeakSequence(object):
         return len(self._storage)
 
     def __iter__(self):
-        return (obj for obj in (ref() for ref in self._storage) if obj is not None)
+        return (
+            obj for obj in map(weakref.ref.__call__, self._storage) if obj is not None
+        )
 
     def __getitem__(self, index):
         try:
             obj = self._storage[index]
-        except KeyError:
+        except IndexError:
             raise IndexError("Index %s out of range" % index)
         else:
             return obj()
@@ -726,7 +776,8 @@ class PopulateDict(dict):
         self.creator = creator
 
     def __missing__(self, key):
-        self[key] = val = self.creator(key)
+        val = self.creator(key)
+        dict.__setitem__(self, key, val)
         return val
 
 
@@ -742,7 +793,8 @@ class WeakPopulateDict(dict):
         self.weakself = weakref.ref(weakself)
 
     def __missing__(self, key):
-        self[key] = val = self.creator(self.weakself(), key)
+        val = self.creator(self.weakself(), key)
+        dict.__setitem__(self, key, val)
         return val
 
 
@@ -761,6 +813,8 @@ _property_getters = PopulateDict(lambda idx: property(operator.itemgetter(idx)))
 
 
 def unique_list(seq, hashfunc=None):
+    if not hashfunc and py37:
+        return list(dict.fromkeys(seq))
     seen = set()
     seen_add = seen.add
     if not hashfunc:
@@ -778,7 +832,8 @@ class UniqueAppender(object):
 
     def __init__(self, data, via=None):
         self.data = data
-        self._unique = {}
+        self._unique = set()
+        self._seen_add = self._unique.add
         if via:
             self._data_appender = getattr(data, via)
         elif hasattr(data, "append"):
@@ -790,7 +845,7 @@ class UniqueAppender(object):
         id_ = id(item)
         if id_ not in self._unique:
             self._data_appender(item)
-            self._unique[id_] = True
+            self._seen_add(id_)
 
     def __iter__(self):
         return iter(self.data)
@@ -804,7 +859,9 @@ def coerce_generator_arg(arg):
 
 
 def to_list(x, default=None):
-    if x is None:
+    if x.__class__ is list:
+        return x
+    elif x is None:
         return default
     if not isinstance(x, collections_abc.Iterable) or isinstance(
         x, string_types + binary_types
@@ -823,12 +880,14 @@ def has_intersection(set_, iterable):
     on items in iterable that don't support it.
 
     """
-    # TODO: optimize, write in C, etc.
-    return bool(set_.intersection([i for i in iterable if i.__hash__]))
+    contains = set_.__contains__
+    return any(contains(i) for i in iterable if i.__hash__)
 
 
 def to_set(x):
-    if x is None:
+    if x.__class__ is set:
+        return x
+    elif x is None:
         return set()
     if not isinstance(x, set):
         return set(to_list(x))
@@ -860,12 +919,16 @@ def flatten_iterator(x):
     iterators, flatten the sub-elements into a single iterator.
 
     """
-    for elem in x:
-        if not isinstance(elem, str) and hasattr(elem, "__iter__"):
-            for y in flatten_iterator(elem):
-                yield y
+    stack = [iter(x)]
+    while stack:
+        for elem in stack[-1]:
+            if not isinstance(elem, str) and hasattr(elem, "__iter__"):
+                stack.append(iter(elem))
+                break
+            else:
+                yield elem
         else:
-            yield elem
+            stack.pop()
 
 
 class LRUCache(dict):
@@ -884,24 +947,20 @@ class LRUCache(dict):
         self.capacity = capacity
         self.threshold = threshold
         self.size_alert = size_alert
-        self._counter = 0
+        self._counter = itertools.count(1)
         self._mutex = threading.Lock()
 
-    def _inc_counter(self):
-        self._counter += 1
-        return self._counter
-
     def get(self, key, default=None):
         item = dict.get(self, key, default)
         if item is not default:
-            item[2] = self._inc_counter()
+            item[2] = next(self._counter)
             return item[1]
         else:
             return default
 
     def __getitem__(self, key):
         item = dict.__getitem__(self, key)
-        item[2] = self._inc_counter()
+        item[2] = next(self._counter)
         return item[1]
 
     def values(self):
@@ -917,7 +976,7 @@ class LRUCache(dict):
     def __setitem__(self, key, value):
         item = dict.get(self, key)
         if item is None:
-            item = [key, value, self._inc_counter()]
+            item = [key, value, next(self._counter)]
             dict.__setitem__(self, key, item)
         else:
             item[1] = value
@@ -932,14 +991,17 @@ class LRUCache(dict):
             return
         try:
             size_alert = bool(self.size_alert)
-            while len(self) > self.capacity + self.capacity * self.threshold:
+            capacity = self.capacity
+            size_threshold = capacity + capacity * self.threshold
+            by_counter = operator.itemgetter(2)
+            while len(self) > size_threshold:
                 if size_alert:
                     size_alert = False
                     self.size_alert(self)
-                by_counter = sorted(
-                    dict.values(self), key=operator.itemgetter(2), reverse=True
+                oldest = heapq.nsmallest(
+                    len(self) - capacity, dict.values(self), key=by_counter
                 )
-                for item in by_counter[self.capacity :]:
+                for item in oldest:
                     try:
                         del self[item[0]]
                     except KeyError:
@@ -949,6 +1011,9 @@ class LRUCache(dict):
             self._mutex.release()
 
 
+_missing = object()
+
+
 class ScopedRegistry(object):
     """A Registry that can store one or multiple instances of a single
     class on the basis of a "scope" function.
@@ -981,10 +1046,11 @@ class ScopedRegistry(object):
 
     def __call__(self):
         key = self.scopefunc()
-        try:
-            return self.registry[key]
-        except KeyError:
-            return self.registry.setdefault(key, self.createfunc())
+        registry = self.registry
+        value = registry.get(key, _missing)
+        if value is _missing:
+            value = registry.setdefault(key, self.createfunc())
+        return value
 
     def has(self):
         """Return True if an object is present in the current scope."""
@@ -1016,23 +1082,21 @@ class ThreadLocalRegistry(ScopedRegistry):
         self.registry = threading.local()
 
     def __call__(self):
-        try:
-            return self.registry.value
-        except AttributeError:
-            val = self.registry.value = self.createfunc()
-            return val
+        # the threading.local __dict__ is the one for the current thread
+        local_dict = self.registry.__dict__
+        value = local_dict.get("value", _missing)
+        if value is _missing:
+            value = local_dict["value"] = self.createfunc()
+        return value
 
     def has(self):
-        return hasattr(self.registry, "value")
+        return "value" in self.registry.__dict__
 
     def set(self, obj):
         self.registry.value = obj
 
     def clear(self):
-        try:
-            del self.registry.value
-        except AttributeError:
-            pass
+        self.registry.__dict__.pop("value", None)
 
 
 def has_dupes(sequence, target):
@@ -1045,12 +1109,11 @@ def has_dupes(sequence, target):
     # overhead and is usually the same speed.  At 15000 items (way bigger than
     # a relationship-bound collection in memory usually is) it begins to
     # fall behind the other version only by microseconds.
-    c = 0
-    for item in sequence:
+    it = iter(sequence)
+    for item in it:
         if item is target:
-            c += 1
-            if c > 1:
-                return True
+            # resume the same iterator past the first match
+            return any(item is target for item in it)
     return False
 
 
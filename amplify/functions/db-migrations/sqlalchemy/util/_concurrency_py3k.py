@@ -6,7 +6,6 @@
 # the MIT License: https://www.opensource.org/licenses/mit-license.php
 
 import asyncio
-import sys
 from typing import Any
 from typing import Callable
 from typing import Coroutine
@@ -22,6 +21,8 @@ from .. import exc
 # Refs: https://github.com/python-greenlet/greenlet/pull/198
 _has_gr_context = hasattr(greenlet.getcurrent(), "gr_context")
 
+_getcurrent = greenlet.getcurrent
+
 
 def is_exit_exception(e):
     # note asyncio.CancelledError is already BaseException
@@ -37,12 +38,21 @@ def is_exit_exception(e):
 
 
 class _AsyncIoGreenlet(greenlet.greenlet):
-    def __init__(self, fn, driver):
-        greenlet.greenlet.__init__(self, fn, driver)
-        self.driver = driver
-        if _has_gr_context:
+    __slots__ = ("driver",)
+
+    if _has_gr_context:
+
+        def __init__(self, fn, driver):
+            greenlet.greenlet.__init__(self, fn, driver)
+            self.driver = driver
             self.gr_context = driver.gr_context
 
+    else:
+
+        def __init__(self, fn, driver):
+            greenlet.greenlet.__init__(self, fn, driver)
+            self.driver = driver
+
 
 def await_only(awaitable: Coroutine) -> Any:
     """Awaits an async function in a sync method.
@@ -54,8 +64,10 @@ def await_only(awaitable: Coroutine) -> Any:
 
     """
     # this is called in the context greenlet while running fn
-    current = greenlet.getcurrent()
-    if not isinstance(current, _AsyncIoGreenlet):
+    current = _getcurrent()
+    if type(current) is not _AsyncIoGreenlet and not isinstance(
+        current, _AsyncIoGreenlet
+    ):
         raise exc.MissingGreenlet(
             "greenlet_spawn has not been called; can't call await_only() "
             "here. Was IO attempted in an unexpected place?"
@@ -117,16 +129,17 @@ async def greenlet_spawn(fn: Callable, *args, _require_await=False, **kwargs) ->
                 # wait for a coroutine from await_only and then return its
                 # result back to it.
                 value = await result
-            except BaseException:
+            except BaseException as err:
                 # this allows an exception to be raised within
                 # the moderated greenlet so that it can continue
-                # its expected flow.
-                result = context.throw(*sys.exc_info())
+                # its expected flow.  the traceback is passed along
+                # explicitly so that older Pythons don't drop it
+                result = context.throw(type(err), err, err.__traceback__)
             else:
                 result = context.switch(value)
     finally:
         # clean up to avoid cycle resolution by gc
-        del context.driver
+        context.driver = None
     if _require_await and not switch_occurred:
         raise exc.AwaitRequired(
             "The current operation required an async execution but none was "
@@ -177,16 +190,18 @@ def _util_async_run(fn, *args, **kwargs):
         return fn(*args, **kwargs)
 
 
-def get_event_loop():
-    """vendor asyncio.get_event_loop() for python 3.7 and above.
+if compat.py37:
 
-    Python 3.10 deprecates get_event_loop() as a standalone.
+    def get_event_loop():
+        """vendor asyncio.get_event_loop() for python 3.7 and above.
 
-    """
-    if compat.py37:
+        Python 3.10 deprecates get_event_loop() as a standalone.
+
+        """
         try:
             return asyncio.get_running_loop()
         except RuntimeError:
             return asyncio.get_event_loop_policy().get_event_loop()
-    else:
-        return asyncio.get_event_loop()
+
+else:
+    get_event_loop = asyncio.get_event_loop
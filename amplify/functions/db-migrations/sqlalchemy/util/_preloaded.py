@@ -10,6 +10,7 @@ runtime.
 
 """
 
+import bisect
 import sys
 
 from . import compat
@@ -36,7 +37,11 @@ class _ModuleRegistry:
     """
 
     def __init__(self, prefix="sqlalchemy."):
-        self.module_registry = set()
+        # maps each registered module name to its key in __dict__
+        self.module_registry = {}
+        # the same module names kept in sorted order, so that the
+        # modules under a path form one contiguous run
+        self._sorted_modules = []
         self.prefix = prefix
 
     def preload_module(self, *deps):
@@ -45,19 +50,30 @@ class _ModuleRegistry:
         This method can be used both as a normal function and as a decorator.
         No change is performed to the decorated object.
         """
-        self.module_registry.update(deps)
+        for module in deps:
+            if module not in self.module_registry:
+                if self.prefix:
+                    key = module.split(self.prefix)[-1].replace(".", "_")
+                else:
+                    key = module
+                self.module_registry[module] = key
+                bisect.insort(self._sorted_modules, module)
         return lambda fn: fn
 
     def import_prefix(self, path):
         """Resolve all the modules in the registry that start with the
         specified path.
         """
-        for module in self.module_registry:
-            if self.prefix:
-                key = module.split(self.prefix)[-1].replace(".", "_")
-            else:
-                key = module
-            if (not path or module.startswith(path)) and key not in self.__dict__:
+        sorted_modules = self._sorted_modules
+        start = bisect.bisect_left(sorted_modules, path)
+        end = start
+        while end < len(sorted_modules) and sorted_modules[end].startswith(path):
+            end += 1
+
+        # importing may register more modules; work from a copy of the run
+        for module in sorted_modules[start:end]:
+            key = self.module_registry[module]
+            if key not in self.__dict__:
                 compat.import_(module, globals(), locals())
                 self.__dict__[key] = sys.modules[module]
 
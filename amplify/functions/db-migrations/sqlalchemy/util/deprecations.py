@@ -21,22 +21,27 @@ from .langhelpers import inject_param_text
 from .. import exc
 
 
+_truthy_env_values = frozenset(("true", "yes", "1"))
+
+
+def _env_truthy(name):
+    return os.getenv(name, "false").lower() in _truthy_env_values
+
+
 SQLALCHEMY_WARN_20 = False
 
 SILENCE_UBER_WARNING = False
 
-if os.getenv("SQLALCHEMY_WARN_20", "false").lower() in ("true", "yes", "1"):
+if _env_truthy("SQLALCHEMY_WARN_20"):
     SQLALCHEMY_WARN_20 = True
 
 if compat.py2k:
     SILENCE_UBER_WARNING = True
-elif os.getenv("SQLALCHEMY_SILENCE_UBER_WARNING", "false").lower() in (
-    "true",
-    "yes",
-    "1",
-):
+elif _env_truthy("SQLALCHEMY_SILENCE_UBER_WARNING"):
     SILENCE_UBER_WARNING = True
 
+_TERM = os.environ.get("TERM")
+
 
 def _warn_with_version(msg, version, type_, stacklevel, code=None):
     if issubclass(type_, exc.Base20DeprecationWarning) and not SQLALCHEMY_WARN_20:
@@ -51,6 +56,34 @@ def _warn_with_version(msg, version, type_, stacklevel, code=None):
     _warnings_warn(warn, stacklevel=stacklevel + 1)
 
 
+_uber_warning_template = (
+    "%(red)sDeprecated API features detected! "
+    "These feature(s) are not compatible with SQLAlchemy 2.0. "
+    "%(green)sTo prevent incompatible upgrades prior to updating "
+    "applications, ensure requirements files are "
+    'pinned to "sqlalchemy<2.0". '
+    "%(cyan)sSet environment variable SQLALCHEMY_WARN_20=1 to show all "
+    "deprecation warnings.  Set environment variable "
+    "SQLALCHEMY_SILENCE_UBER_WARNING=1 to silence this message.%(nocolor)s"
+)
+
+_uber_warning_color = _uber_warning_template % {
+    "red": "\x1b[31m",
+    "cyan": "\x1b[36m",
+    "green": "\x1b[32m",
+    "magenta": "\x1b[35m",
+    "nocolor": "\x1b[0m",
+}
+
+_uber_warning_plain = _uber_warning_template % {
+    "red": "",
+    "cyan": "",
+    "green": "",
+    "magenta": "",
+    "nocolor": "",
+}
+
+
 def _emit_uber_warning(type_, stacklevel):
     global SILENCE_UBER_WARNING
 
@@ -62,37 +95,12 @@ def _emit_uber_warning(type_, stacklevel):
     file_ = sys.stderr
 
     # source: https://github.com/pytest-dev/pytest/blob/326ae0cd88f5e954c8effc2b0c986832e9caff11/src/_pytest/_io/terminalwriter.py#L35-L37  # noqa: E501
-    use_color = (
-        hasattr(file_, "isatty") and file_.isatty() and os.environ.get("TERM") != "dumb"
-    )
-
-    msg = (
-        "%(red)sDeprecated API features detected! "
-        "These feature(s) are not compatible with SQLAlchemy 2.0. "
-        "%(green)sTo prevent incompatible upgrades prior to updating "
-        "applications, ensure requirements files are "
-        'pinned to "sqlalchemy<2.0". '
-        "%(cyan)sSet environment variable SQLALCHEMY_WARN_20=1 to show all "
-        "deprecation warnings.  Set environment variable "
-        "SQLALCHEMY_SILENCE_UBER_WARNING=1 to silence this message.%(nocolor)s"
-    )
+    use_color = hasattr(file_, "isatty") and file_.isatty() and _TERM != "dumb"
 
     if use_color:
-        msg = msg % {
-            "red": "\x1b[31m",
-            "cyan": "\x1b[36m",
-            "green": "\x1b[32m",
-            "magenta": "\x1b[35m",
-            "nocolor": "\x1b[0m",
-        }
+        msg = _uber_warning_color
     else:
-        msg = msg % {
-            "red": "",
-            "cyan": "",
-            "green": "",
-            "magenta": "",
-            "nocolor": "",
-        }
+        msg = _uber_warning_plain
 
     # note this is a exc.Base20DeprecationWarning subclass, which
     # will implicitly add the link to the SQLAlchemy 2.0 page in the message
@@ -238,12 +246,17 @@ def moved_20(message, **kw):
     return deprecated("2.0", message=message, warning=exc.MovedIn20Warning, **kw)
 
 
+_api_name_types = (
+    (":attr:", "attribute"),
+    (":func:", "function"),
+    (":meth:", "method"),
+)
+
+
 def deprecated_20(api_name, alternative=None, becomes_legacy=False, **kw):
-    type_reg = re.match("^:(attr|func|meth):", api_name)
-    if type_reg:
-        type_ = {"attr": "attribute", "func": "function", "meth": "method"}[
-            type_reg.group(1)
-        ]
+    for role, type_ in _api_name_types:
+        if api_name.startswith(role):
+            break
     else:
         type_ = "construct"
     message = (
@@ -322,35 +335,40 @@ def deprecated_params(**specs):
 
         check_any_kw = spec.varkw
 
+        # resolve everything the per-call checks need up front, so that
+        # warned() only unpacks tuples
+        default_checks = tuple(
+            (m, defaults[m], messages[m], versions[m], version_warnings[m])
+            for m in check_defaults
+        )
+        kw_checks = tuple(
+            (m, messages[m], versions[m], version_warnings[m]) for m in check_kw
+        )
+        if check_any_kw in messages:
+            any_kw_check = (
+                messages[check_any_kw],
+                versions[check_any_kw],
+                version_warnings[check_any_kw],
+            )
+        else:
+            any_kw_check = None
+
         @decorator
         def warned(fn, *args, **kwargs):
-            for m in check_defaults:
-                if (defaults[m] is None and kwargs[m] is not None) or (
-                    defaults[m] is not None and kwargs[m] != defaults[m]
+            for m, default, message, version, wtype in default_checks:
+                value = kwargs[m]
+                if (default is None and value is not None) or (
+                    default is not None and value != default
                 ):
-                    _warn_with_version(
-                        messages[m],
-                        versions[m],
-                        version_warnings[m],
-                        stacklevel=3,
-                    )
-
-            if check_any_kw in messages and set(kwargs).difference(check_defaults):
-                _warn_with_version(
-                    messages[check_any_kw],
-                    versions[check_any_kw],
-                    version_warnings[check_any_kw],
-                    stacklevel=3,
-                )
+                    _warn_with_version(message, version, wtype, stacklevel=3)
+
+            if any_kw_check is not None and set(kwargs).difference(check_defaults):
+                message, version, wtype = any_kw_check
+                _warn_with_version(message, version, wtype, stacklevel=3)
 
-            for m in check_kw:
+            for m, message, version, wtype in kw_checks:
                 if m in kwargs:
-                    _warn_with_version(
-                        messages[m],
-                        versions[m],
-                        version_warnings[m],
-                        stacklevel=3,
-                    )
+                    _warn_with_version(message, version, wtype, stacklevel=3)
             return fn(*args, **kwargs)
 
         doc = fn.__doc__ is not None and fn.__doc__ or ""
@@ -370,15 +388,24 @@ def deprecated_params(**specs):
     return decorate
 
 
+_ref_reg = re.compile(r":ref:`(.+) <.*>`")
+_role_reg = re.compile(r"\:(\w+)\:`~?(?:_\w+)?\.?(.+?)`")
+
+
+def _ref_repl(m):
+    return '"%s"' % m.group(1)
+
+
+def _role_repl(m):
+    type_, name = m.group(1, 2)
+    if type_ in ("func", "meth"):
+        name += "()"
+    return name
+
+
 def _sanitize_restructured_text(text):
-    def repl(m):
-        type_, name = m.group(1, 2)
-        if type_ in ("func", "meth"):
-            name += "()"
-        return name
-
-    text = re.sub(r":ref:`(.+) <.*>`", lambda m: '"%s"' % m.group(1), text)
-    return re.sub(r"\:(\w+)\:`~?(?:_\w+)?\.?(.+?)`", repl, text)
+    text = _ref_reg.sub(_ref_repl, text)
+    return _role_reg.sub(_role_repl, text)
 
 
 def _decorate_cls_with_warning(